@@ -17,14 +17,20 @@ def set_page_config():
     )
 
 
-def main():
-    set_page_config()
+@st.cache_resource(show_spinner=False)
+def build_chatbot():
+    """Build the RAG pipeline, evaluator and chatbot once per process"""
     llm_config = load_llm_config()
     rag = Predictor(chunk_size=llm_config['retriever_chunk_size'])
     evaluator = CortextEvaluator().get_evaluator(
         rag, llm_config
     )
-    chatbot = StreamlitChatBot(evaluator, rag)
+    return StreamlitChatBot(evaluator, rag)
+
+
+def main():
+    set_page_config()
+    chatbot = build_chatbot()
     chatbot.create_bot()
 
 if __name__ == "__main__":
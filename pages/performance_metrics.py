@@ -13,7 +13,8 @@ def set_page_config():
 
 def main():
     set_page_config()
-    PerformanceMetrics()
+    pm = st.session_state.setdefault('perf_metrics', PerformanceMetrics())
+    pm.render()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
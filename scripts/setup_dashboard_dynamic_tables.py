@@ -0,0 +1,111 @@
+import os
+from dotenv import load_dotenv
+import snowflake.connector
+
+# One-time setup: precompute the dashboard aggregations in Snowflake
+# dynamic tables so the read path becomes a trivial row selection.
+# The tables refresh in the background on the same cadence as the
+# dashboard (Defaults.DASHBOARD_REFRESH_RATE = 5 minutes); enable
+# Defaults.DASHBOARD_USE_DYNAMIC_TABLES after running this script.
+
+TARGET_LAG = "5 minutes"
+
+HOURLY_LATENCY_SQL = """
+    WITH parsed AS (
+        SELECT
+            DATE_TRUNC('hour', TO_TIMESTAMP_NTZ(r.TS::int)) as time,
+            a.APP_VERSION,
+            PARSE_JSON(r.RECORD_JSON):perf as PERF
+        FROM TRULENS_RECORDS r
+        JOIN TRULENS_APPS a ON r.APP_ID = a.APP_ID
+    ),
+    latency AS (
+        SELECT
+            time,
+            APP_VERSION,
+            TIMESTAMPDIFF(
+                'MILLISECOND',
+                TO_TIMESTAMP(PERF:start_time::string),
+                TO_TIMESTAMP(PERF:end_time::string)
+            ) / 1000.0 as latency
+        FROM parsed
+    )
+    SELECT
+        time,
+        APP_VERSION,
+        MIN(latency) as min_latency,
+        AVG(latency) as avg_latency,
+        MAX(latency) as max_latency,
+        COUNT(*) as request_count
+    FROM latency
+    GROUP BY time, APP_VERSION
+"""
+
+HOURLY_COST_SQL = """
+    WITH parsed AS (
+        SELECT
+            DATE_TRUNC('hour', TO_TIMESTAMP_NTZ(r.TS::int)) as TIME,
+            a.APP_VERSION,
+            PARSE_JSON(r.COST_JSON) as COST_OBJ
+        FROM TRULENS_RECORDS r
+        JOIN TRULENS_APPS a ON r.APP_ID = a.APP_ID
+        WHERE r.COST_JSON IS NOT NULL
+    )
+    SELECT
+        TIME,
+        APP_VERSION,
+        COUNT(*) as QUERY_COUNT,
+        SUM(COST_OBJ:n_tokens::number) as TOKENS,
+        SUM(COST_OBJ:n_prompt_tokens::number) as PROMPT_TOKENS,
+        SUM(COST_OBJ:n_completion_tokens::number) as COMPLETION_TOKENS,
+        SUM(COST_OBJ:cost::number) as COST,
+        MAX(COST_OBJ:cost_currency::string) as CURRENCY
+    FROM parsed
+    WHERE COST_OBJ:cost IS NOT NULL
+    GROUP BY TIME, APP_VERSION
+"""
+
+DYNAMIC_TABLES = {
+    "DASHBOARD_HOURLY_LATENCY": HOURLY_LATENCY_SQL,
+    "DASHBOARD_HOURLY_COST": HOURLY_COST_SQL,
+}
+
+
+def create_dynamic_table(conn, name, select_sql, warehouse):
+    """Create or replace one dashboard dynamic table."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            f"CREATE OR REPLACE DYNAMIC TABLE {name} "
+            f"TARGET_LAG = '{TARGET_LAG}' "
+            f"WAREHOUSE = {warehouse} "
+            f"AS {select_sql}"
+        )
+    finally:
+        cursor.close()
+
+
+def main():
+    load_dotenv()
+    warehouse = os.getenv("SNOWFLAKE_WAREHOUSE")
+    conn = snowflake.connector.connect(
+        account=os.getenv("SNOWFLAKE_ACCOUNT"),
+        user=os.getenv("SNOWFLAKE_USER"),
+        password=os.getenv("SNOWFLAKE_USER_PASSWORD"),
+        role=os.getenv("SNOWFLAKE_ROLE"),
+        database=os.getenv("SNOWFLAKE_DATABASE"),
+        schema=os.getenv("SNOWFLAKE_SCHEMA"),
+        warehouse=warehouse,
+    )
+
+    try:
+        for name, select_sql in DYNAMIC_TABLES.items():
+            print(f"Creating dynamic table {name}...")
+            create_dynamic_table(conn, name, select_sql, warehouse)
+            print(f"Created {name} successfully.")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,65 @@
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
 from src.classes.base.base_rag import BaseRag
 from src.classes.snowflake.cortex_search_retriever import CortexSearchRetriever
 from src.utils.config import Defaults
 from src.utils.session import session
-from snowflake.cortex import complete
+
+# Bounds for the exact-match answer cache: enough entries to cover the
+# common repeat questions without letting a long-lived process grow
+# unbounded, and a TTL so stale answers age out if the corpus changes.
+_ANSWER_CACHE_SIZE = 512
+_ANSWER_CACHE_TTL = 1800  # seconds
+
+# Semantic cache for retrieved context: paraphrases of an earlier
+# question reuse its context list when the query embeddings agree.
+_EMBED_MODEL = "e5-base-v2"
+_EMBED_DIM = 768
+_LSH_BITS = 16
+_SEMANTIC_THRESHOLD = 0.95
+_CONTEXT_CACHE_SIZE = 256
+
+# Static instruction block for the answer prompt. Kept as one module-level
+# constant so every request sends a byte-identical prefix before the
+# variable context/question suffix — the stable prefix is what lets the
+# serving side reuse its tokenization/prefill work across requests.
+_ANSWER_PROMPT_PREFIX = (
+    "You are an expert assistant extracting information from context provided.\n"
+    "Answer the question based on the context. Be concise and do not"
+    " hallucinate.\n"
+    "If you don't have the information just say so.\n"
+)
+
+logger = logging.getLogger(__name__)
+
+_complete = None
+_embed_text = None
+
+
+def _get_complete():
+    """Import `snowflake.cortex.complete` on first use.
+
+    The import pulls in the whole Cortex client stack and costs hundreds of
+    ms, so it is deferred out of the Streamlit cold path.
+    """
+    global _complete
+    if _complete is None:
+        from snowflake.cortex import complete as _complete
+    return _complete
+
+
+def _get_embed_text():
+    """Import `snowflake.cortex.embed_text_768` on first use."""
+    global _embed_text
+    if _embed_text is None:
+        from snowflake.cortex import embed_text_768 as _embed_text
+    return _embed_text
 
 
 class Predictor(BaseRag):
@@ -11,30 +68,163 @@ class Predictor(BaseRag):
         self.retriever = CortexSearchRetriever(
             snowpark_session=session.snowpark_session, limit_to_retrieve=chunk_size
         )
+        # Exact-match answer cache keyed by the normalized standalone
+        # question. Repeat questions become a dict lookup instead of a
+        # Cortex search plus a completion round trip. The lock matters
+        # because Streamlit serves concurrent sessions from one process.
+        self._answer_cache = OrderedDict()
+        self._answer_cache_lock = threading.Lock()
+        # Random-projection LSH over query embeddings: near-duplicate
+        # questions land in the same (or a 1-bit-adjacent) bucket, and a
+        # cosine check against the stored vectors confirms the match. The
+        # fixed seed keeps bucket assignment stable across sessions.
+        self._projection = (
+            np.random.default_rng(0)
+            .standard_normal((_EMBED_DIM, _LSH_BITS))
+            .astype(np.float32)
+        )
+        self._context_cache = {}
+        self._context_cache_len = 0
+        self._context_cache_lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        """Normalize a query for cache lookups.
+
+        Lowercases, strips punctuation and collapses whitespace so
+        trivially different phrasings of the same question share a key.
+        """
+        return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", "", query.lower())).strip()
+
+    def _cached_answer(self, key: str):
+        """Return the cached response for `key`, or None if absent/expired."""
+        with self._answer_cache_lock:
+            entry = self._answer_cache.get(key)
+            if entry is None:
+                return None
+            response, stored_at = entry
+            if time.monotonic() - stored_at > _ANSWER_CACHE_TTL:
+                del self._answer_cache[key]
+                return None
+            self._answer_cache.move_to_end(key)
+            return response
+
+    def _store_answer(self, key: str, response: dict):
+        with self._answer_cache_lock:
+            self._answer_cache[key] = (response, time.monotonic())
+            self._answer_cache.move_to_end(key)
+            while len(self._answer_cache) > _ANSWER_CACHE_SIZE:
+                self._answer_cache.popitem(last=False)
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Embed `query` and return the unit-normalized vector."""
+        embedding = np.asarray(
+            _get_embed_text()(_EMBED_MODEL, query, session=session.snowpark_session),
+            dtype=np.float32,
+        )
+        norm = np.linalg.norm(embedding)
+        if norm:
+            embedding = embedding / norm
+        return embedding
+
+    def _lsh_signature(self, embedding: np.ndarray) -> int:
+        """Project the embedding onto the random hyperplanes; one bit each."""
+        bits = embedding @ self._projection > 0
+        signature = 0
+        for bit in bits:
+            signature = (signature << 1) | int(bit)
+        return signature
+
+    def _cached_context(self, signature: int, embedding: np.ndarray):
+        """Look up a semantically-matching context for `embedding`.
+
+        Probes the signature's own bucket plus its 1-bit Hamming
+        neighbors, then confirms with an exact cosine check so a bucket
+        collision can never return unrelated context.
+        """
+        probes = [signature] + [signature ^ (1 << i) for i in range(_LSH_BITS)]
+        with self._context_cache_lock:
+            for probe in probes:
+                for stored_embedding, context in self._context_cache.get(probe, ()):
+                    if float(embedding @ stored_embedding) >= _SEMANTIC_THRESHOLD:
+                        return context
+        return None
+
+    def _store_context(self, signature: int, embedding: np.ndarray, context: list):
+        with self._context_cache_lock:
+            if self._context_cache_len >= _CONTEXT_CACHE_SIZE:
+                # Wholesale reset rather than per-entry LRU bookkeeping;
+                # the cache refills quickly and stays trivially bounded.
+                self._context_cache = {}
+                self._context_cache_len = 0
+            self._context_cache.setdefault(signature, []).append((embedding, context))
+            self._context_cache_len += 1
 
     def retrieve_context(self, query: str) -> list:
         """
         Retrieve relevant text from vector store.
+
+        Near-duplicate queries (cosine >= threshold on e5 embeddings of a
+        prior question) reuse the previously retrieved context instead of
+        re-running the Cortex search. The embedding RPC this costs is far
+        cheaper than the search it saves on a hit.
         """
-        return self.retriever.retrieve(query)
+        try:
+            embedding = self._embed_query(query)
+        except Exception:
+            # The cache is an optimization: if the embedding RPC fails
+            # (model unavailable in the region, transient error), run the
+            # search as usual instead of failing the whole turn.
+            logger.exception("Semantic-cache embedding failed; skipping cache")
+            return self.retriever.retrieve(query)
+        signature = self._lsh_signature(embedding)
+        cached = self._cached_context(signature, embedding)
+        if cached is not None:
+            return cached
+        context = self.retriever.retrieve(query)
+        self._store_context(signature, embedding, context)
+        return context
+
+    def build_completion_prompt(self, query: str, context_str: list) -> str:
+        """Build the answer prompt shared by the blocking and streaming paths.
+
+        Static instructions first, variable context and question after, so
+        the instruction prefix stays identical from request to request.
+        """
+        return (
+            f"{_ANSWER_PROMPT_PREFIX}"
+            f"Context: {context_str}\n"
+            f"Question:\n{query}\n"
+            f"Answer:"
+        )
 
     def generate_completion(
-        self, query: str, context_str: list, model_name=Defaults.LLM_MODEL
+        self, query: str, context_str: list, model_name=Defaults.LLM_MODEL,
+        stream_handler=None,
     ) -> dict:
         """
         Generate answer from context with source references.
         Returns a dict containing the answer and sources.
+
+        When `stream_handler` is given the completion is streamed and each
+        token chunk is passed to it as it arrives; the assembled answer is
+        still returned as usual, so this instrumented call remains the one
+        trulens records, with the final answer as its output.
         """
-        prompt = f"""
-            You are an expert assistant extracting information from context provided.
-            Answer the question based on the context. Be concise and do not hallucinate.
-            If you don´t have the information just say so.
-            Context: {context_str}
-            Question:
-            {query}
-            Answer:
-        """
-        answer = complete(model_name, prompt, session=session.snowpark_session)
+        prompt = self.build_completion_prompt(query, context_str)
+        if stream_handler is None:
+            answer = _get_complete()(
+                model_name, prompt, session=session.snowpark_session
+            )
+        else:
+            pieces = []
+            stream = _get_complete()(
+                model_name, prompt, session=session.snowpark_session, stream=True
+            )
+            for chunk in stream:
+                stream_handler(chunk)
+                pieces.append(str(chunk))
+            answer = "".join(pieces)
 
         # Extract source filenames from the context results
         sources = [
@@ -55,10 +245,24 @@ class Predictor(BaseRag):
             User Question: {query}
             Standalone question:
         """
-        return complete(model_name, prompt, session=session.snowpark_session)
+        return _get_complete()(model_name, prompt, session=session.snowpark_session)
 
-    def query(self, query: str, history: list) -> dict:
+    def query(self, query: str, history: list, stream_handler=None) -> dict:
         standalone_question = self.generate_standalone_question(query, history)
-        print(f"Standalone Question: {standalone_question}")
+        # Keyed on the standalone question rather than the raw query so
+        # history-dependent follow-ups ("what about that?") cannot collide.
+        key = self._normalize(standalone_question)
+        cached = self._cached_answer(key)
+        if cached is not None:
+            # A streaming caller still gets its callback invoked, so a hit
+            # renders through the same path as a live stream — just all at
+            # once instead of token by token.
+            if stream_handler is not None:
+                stream_handler(cached["answer"])
+            return cached
         context_str = self.retrieve_context(standalone_question)
-        return self.generate_completion(query, context_str)
+        response = self.generate_completion(
+            query, context_str, stream_handler=stream_handler
+        )
+        self._store_answer(key, response)
+        return response
@@ -1,18 +1,20 @@
 from src.classes.base.base_evaluator import BaseEvaluator
-from trulens.providers.cortex.provider import Cortex
-from trulens.core import Feedback, Select
-from trulens.apps.custom import TruCustomApp, instrument
+import functools
 import numpy as np
 from typing import Any
 from src.utils.session import session
 from src.classes.base.base_rag import BaseRag
 
 class CortextEvaluator(BaseEvaluator):
+    # The trulens imports are deferred into the methods below: they pull in
+    # the full instrumentation stack and add hundreds of ms to every
+    # Streamlit cold start, even for pages that never build an evaluator.
 
     def get_groundedness_feedback(self) -> Any:
+        from trulens.core import Feedback, Select
         return (
             Feedback(
-                self.get_feedback_provider().groundedness_measure_with_cot_reasons,
+                self.feedback_provider.groundedness_measure_with_cot_reasons,
                 name="Groundedness",
             )
             .on(Select.RecordCalls.retrieve_context.rets[:].collect())
@@ -20,9 +22,10 @@ class CortextEvaluator(BaseEvaluator):
         )
 
     def get_context_relevance(self) -> Any:
+        from trulens.core import Feedback, Select
         return (
             Feedback(
-                self.get_feedback_provider().context_relevance, name="Context Relevance"
+                self.feedback_provider.context_relevance, name="Context Relevance"
             )
             .on_input()
             .on(Select.RecordCalls.retrieve_context.rets[:])
@@ -30,23 +33,41 @@ class CortextEvaluator(BaseEvaluator):
         )
 
     def get_answer_relevance(self) -> Any:
+        from trulens.core import Feedback
         return (
-            Feedback(self.get_feedback_provider().relevance, name="Answer Relevance")
+            Feedback(self.feedback_provider.relevance, name="Answer Relevance")
             .on_input()
             .on_output()
             .aggregate(np.mean)
         )
 
     def get_cost_feedback(self) -> Any:
+        from trulens.core import Feedback
         return Feedback(
-            self.get_feedback_provider().cost_estimate,
+            self.feedback_provider.cost_estimate,
             name="Cost"
         ).on_output()
 
-    def get_feedback_provider(self) -> Any:
+    @functools.cached_property
+    def feedback_provider(self) -> Any:
+        # One provider per evaluator: the Cortex constructor does
+        # import/validation work and is otherwise re-run for each of the
+        # three feedbacks built in get_evaluator.
+        from trulens.providers.cortex.provider import Cortex
         return Cortex(session.snowpark_session)
 
+    def get_feedback_provider(self) -> Any:
+        return self.feedback_provider
+
     def get_evaluator(self, rag: BaseRag, llm_cofig:dict) -> Any:
+        from trulens.apps.custom import TruCustomApp, instrument
+        from trulens.core.schema.feedback import FeedbackMode
+
+        # Make sure the TruLens session (and its Snowflake connector) is
+        # initialized before the app is registered, now that AppSession
+        # builds it lazily.
+        _ = session.tru_session
+
         instrument.method(BaseRag, BaseRag.generate_completion.__name__)
         instrument.method(BaseRag, BaseRag.query.__name__)
         instrument.method(BaseRag, BaseRag.retrieve_context.__name__)
@@ -60,5 +81,9 @@ class CortextEvaluator(BaseEvaluator):
                 self.get_answer_relevance(),
                 self.get_context_relevance()
             ],
-            metadata=llm_cofig
+            metadata=llm_cofig,
+            # The three feedbacks are independent Cortex RPCs; evaluating
+            # them on trulens' worker threads instead of the app thread
+            # lets them overlap each other and the next user turn.
+            feedback_mode=FeedbackMode.WITH_APP_THREAD,
         )
@@ -1,7 +1,35 @@
+import functools
+import html
 import streamlit as st
 from src.utils.config import Defaults
 
 
+# Built once at import; re-emitted (cheaply) each run because Streamlit
+# drops any element that is not part of the current rerun, so a one-shot
+# cache_resource/session-state guard would lose the style on rerun.
+_IMAGE_CSS = (
+    '<style>div[data-testid="stImage"] img '
+    '{max-height: 50px; width: auto;}</style>'
+)
+
+# Bounds on the chat transcript: stored history is trimmed so a marathon
+# session cannot grow rerun cost without limit, and only the most recent
+# messages render inline — anything older collapses into an expander.
+_HISTORY_LIMIT = 50
+_VISIBLE_MESSAGES = 20
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_source_link(source: str, base_url: str = Defaults.SITE_DOMAIN_PREFIX) -> str:
+    """Format a source filename as a clickable link.
+
+    Memoized because every rerun re-renders every historical message's
+    sources; the formatting is O(1) per unique source this way.
+    """
+    filename = source.rsplit('.', 1)[0]
+    return f"[{base_url}{filename}]({base_url}{filename})"
+
+
 class StreamlitChatBot:
     def __init__(self, evaluator, rag):
         self.evaluator = evaluator
@@ -21,7 +49,7 @@ class StreamlitChatBot:
     def create_main_content(self):
         """Create the main chatbot content"""
         container = st.container()
-        container.markdown('<style>div[data-testid="stImage"] img {max-height: 50px; width: auto;}</style>', unsafe_allow_html=True)
+        container.markdown(_IMAGE_CSS, unsafe_allow_html=True)
         with container:
             st.image("src/images/logofull.png")
         st.markdown(
@@ -37,10 +65,7 @@ class StreamlitChatBot:
 
     def format_source_link(self, source: str) -> str:
         """Format source filename as a clickable link"""
-        base_url = Defaults.SITE_DOMAIN_PREFIX
-        # Extract filename without extension
-        filename = source.split('.')[0]
-        return f"[{base_url}{filename}]({base_url}{filename})"
+        return _format_source_link(source)
 
     def display_messages(self, prompt: str):
         """Display user and assistant messages with references"""
@@ -48,42 +73,85 @@ class StreamlitChatBot:
             st.markdown(prompt)
 
         with st.chat_message("assistant"):
-            with st.spinner("Searching policy documents..."):
-                with self.evaluator as recording:
-                    response = self.rag.query(prompt, st.session_state.messages)
-
-                # Display the main answer
-                st.markdown(response["answer"])
-
-                # Display sources in an expander if available
-                if response.get("sources"):
-                    with st.expander("View References"):
-                        st.markdown("Sources:")
-                        for source in response["sources"]:
-                            st.markdown(f"- {self.format_source_link(source)}")
-
-                # Store both answer and sources in session state
-                message = {
-                    "role": "assistant",
-                    "content": response["answer"],
-                    "sources": response.get("sources", [])
-                }
-                st.session_state.messages.append(message)
+            # Stream tokens into the bubble as they arrive; perceived
+            # latency drops to time-to-first-token instead of the full
+            # generation time. The turn runs through the instrumented
+            # query() call, so trulens records the whole pipeline with
+            # the final answer as the record's main output. Repeat
+            # questions are served by the Predictor's answer cache, keyed
+            # on the normalized standalone question.
+            placeholder = st.empty()
+            pieces = []
+
+            def on_chunk(chunk):
+                pieces.append(str(chunk))
+                placeholder.markdown("".join(pieces) + "▌")
+
+            with self.evaluator as recording:
+                response = self.rag.query(
+                    prompt, st.session_state.messages, stream_handler=on_chunk
+                )
+            placeholder.markdown(response["answer"])
+
+            # Display sources in an expander if available
+            if response.get("sources"):
+                with st.expander("View References"):
+                    st.markdown("Sources:")
+                    for source in response["sources"]:
+                        st.markdown(f"- {self.format_source_link(source)}")
+
+            # Store both answer and sources in session state
+            message = {
+                "role": "assistant",
+                "content": response["answer"],
+                "sources": response.get("sources", [])
+            }
+            st.session_state.messages.append(message)
+
+    def render_message(self, message: dict):
+        """Render one historical message as a single markdown delta.
+
+        One st.markdown per message: each component call is a websocket
+        delta, and long sessions were re-sending several deltas per
+        historical message on every rerun.
+        """
+        with st.chat_message(message["role"]):
+            body = message["content"]
+            if message["role"] == "assistant" and message.get("sources"):
+                links = "\n".join(
+                    f"- {self.format_source_link(source)}"
+                    for source in message["sources"]
+                )
+                # The details wrapper needs unsafe_allow_html, so any HTML
+                # in the model output must be escaped before embedding —
+                # only our own <details> markup may reach the page raw.
+                body = (
+                    f"{html.escape(body)}\n\n"
+                    f"<details><summary>View References</summary>\n\n"
+                    f"{links}\n\n</details>"
+                )
+                st.markdown(body, unsafe_allow_html=True)
+            else:
+                st.markdown(body)
 
     def create_chat_interface(self):
         """Create the chat interface with reference support"""
         chat_container = st.container()
         if "messages" not in st.session_state:
             st.session_state.messages = []
+        # Trim in place like a deque(maxlen=...) would, but keep the plain
+        # list so slicing and the prompts built from the history stay as-is.
+        del st.session_state.messages[:-_HISTORY_LIMIT]
 
         with chat_container:
-            for message in st.session_state.messages:
-                with st.chat_message(message["role"]):
-                    st.markdown(message["content"])
-                    if message["role"] == "assistant" and message.get("sources"):
-                        with st.expander("View References"):
-                            for source in message["sources"]:
-                                st.markdown(f"- {self.format_source_link(source)}")
+            messages = st.session_state.messages
+            older = messages[:-_VISIBLE_MESSAGES]
+            if older:
+                with st.expander(f"Earlier messages ({len(older)})"):
+                    for message in older:
+                        self.render_message(message)
+            for message in messages[-_VISIBLE_MESSAGES:]:
+                self.render_message(message)
 
     def create_chat_input(self):
         """Create the chat input area"""
@@ -91,9 +159,18 @@ class StreamlitChatBot:
             st.session_state.messages.append({"role": "user", "content": prompt})
             self.display_messages(prompt)
 
+    @st.fragment
+    def create_chat_area(self):
+        """Chat transcript plus input, scoped to its own fragment.
+
+        A chat turn reruns only this block: the logo, CSS and welcome
+        copy outside it are not re-executed or re-sent.
+        """
+        self.create_chat_interface()
+        self.create_chat_input()
+
     def create_bot(self):
         """Create the chatbot app"""
         # page = self.create_sidebar()
         self.create_main_content()
-        self.create_chat_interface()
-        self.create_chat_input()
\ No newline at end of file
+        self.create_chat_area()
\ No newline at end of file
@@ -9,11 +9,23 @@ class Defaults:
     # Dashboard refresh settings
     DASHBOARD_REFRESH_RATE = 300  # refresh every 5 minutes
     DASHBOARD_MAX_DATAPOINTS = 1000  # maximum number of datapoints to show
+    DASHBOARD_WINDOW_DAYS = 30  # time window scanned by dashboard queries
+    # Read the precomputed dynamic tables instead of aggregating the raw
+    # record tables; requires scripts/setup_dashboard_dynamic_tables.py
+    DASHBOARD_USE_DYNAMIC_TABLES = False
+    # Plotly render mode for line/scatter charts; flip to "svg" for
+    # environments without WebGL
+    DEFAULT_RENDER_MODE = "webgl"
+
+_LLM_CONFIG = {
+    'retriever_chunk_size': Defaults.LLM_RETRIEVE_CHUNK_SIZE,
+    'app_name': Defaults.APP_NAME,
+    'app_version': Defaults.APP_VERSION,
+    'llm_model': Defaults.LLM_MODEL,
+}
+
 
 def load_llm_config():
-    llm_config = dict()
-    llm_config['retriever_chunk_size'] = Defaults.LLM_RETRIEVE_CHUNK_SIZE
-    llm_config['app_name'] = Defaults.APP_NAME
-    llm_config['app_version'] = Defaults.APP_VERSION
-    llm_config['llm_model'] = Defaults.LLM_MODEL
-    return llm_config
\ No newline at end of file
+    # Built once at import; the config is immutable per process, so
+    # callers share the dict and must treat it as read-only.
+    return _LLM_CONFIG
\ No newline at end of file
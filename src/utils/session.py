@@ -1,31 +1,76 @@
 import os
 from dotenv import load_dotenv
-from snowflake.snowpark.session import Session
-from trulens.connectors.snowflake import SnowflakeConnector
-from trulens.core import TruSession
-import snowflake.connector
+import streamlit as st
+
+
+def _connection_params():
+    load_dotenv()
+    return {
+        "account": os.getenv("SNOWFLAKE_ACCOUNT"),
+        "user": os.getenv("SNOWFLAKE_USER"),
+        "password": os.getenv("SNOWFLAKE_USER_PASSWORD"),
+        "role": os.getenv("SNOWFLAKE_ROLE"),
+        "database": os.getenv("SNOWFLAKE_DATABASE"),
+        "schema": os.getenv("SNOWFLAKE_SCHEMA"),
+        "warehouse": os.getenv("SNOWFLAKE_WAREHOUSE"),
+        # Keep the cached connections alive between dashboard loads so an
+        # idle session doesn't expire and pay a fresh TCP/TLS handshake
+        # (and token refresh) on the next query.
+        "client_session_keep_alive": True,
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def get_snowpark_session():
+    from snowflake.snowpark.session import Session
+
+    return Session.builder.configs(_connection_params()).create()
+
+
+@st.cache_resource(show_spinner=False)
+def get_tru_snowflake_connector():
+    from trulens.connectors.snowflake import SnowflakeConnector
+
+    return SnowflakeConnector(snowpark_session=get_snowpark_session())
+
+
+@st.cache_resource(show_spinner=False)
+def get_tru_session():
+    from trulens.core import TruSession
+
+    return TruSession(connector=get_tru_snowflake_connector())
+
+
+@st.cache_resource(show_spinner=False)
+def get_snowflake_connector():
+    import snowflake.connector
+
+    return snowflake.connector.connect(**_connection_params())
 
 
 class AppSession:
-    def __init__(self):
-        load_dotenv()
-
-        connection_params = {
-            "account": os.getenv("SNOWFLAKE_ACCOUNT"),
-            "user": os.getenv("SNOWFLAKE_USER"),
-            "password": os.getenv("SNOWFLAKE_USER_PASSWORD"),
-            "role": os.getenv("SNOWFLAKE_ROLE"),
-            "database": os.getenv("SNOWFLAKE_DATABASE"),
-            "schema": os.getenv("SNOWFLAKE_SCHEMA"),
-            "warehouse": os.getenv("SNOWFLAKE_WAREHOUSE"),
-        }
-
-        self.snowpark_session = Session.builder.configs(connection_params).create()
-        self.tru_snowflake_connector = SnowflakeConnector(
-            snowpark_session=self.snowpark_session
-        )
-        self.tru_session = TruSession(connector=self.tru_snowflake_connector)
-        self.snowflake_connector = snowflake.connector.connect(**connection_params)
+    """Process-wide handles to the Snowflake and TruLens sessions.
+
+    Each connection is an st.cache_resource singleton shared across every
+    Streamlit session, so a new browser tab reuses the existing warehouse
+    connections instead of opening its own.
+    """
+
+    @property
+    def snowpark_session(self):
+        return get_snowpark_session()
+
+    @property
+    def tru_snowflake_connector(self):
+        return get_tru_snowflake_connector()
+
+    @property
+    def tru_session(self):
+        return get_tru_session()
+
+    @property
+    def snowflake_connector(self):
+        return get_snowflake_connector()
 
 
 session = AppSession()